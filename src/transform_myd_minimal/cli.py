@@ -22,13 +22,21 @@ logger = get_logger(__name__)
 __version__ = "4.1.0"
 
 
-def setup_cli():
-    """Set up the command line interface with argparse."""
+def setup_cli(argv: list[str] | None = None):
+    """Set up the command line interface with argparse.
+
+    Args:
+        argv: Command line arguments without the program name. Defaults to
+            ``sys.argv[1:]`` when omitted.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
     # Load configuration to get default values
     config = load_config()
 
     # Check if this is the old format (no subcommand)
-    if len(sys.argv) > 1 and sys.argv[1] not in [
+    if len(argv) > 0 and argv[0] not in [
         "map",
         "index_source",
         "index_target",
@@ -40,16 +48,8 @@ def setup_cli():
         # Old format detected, handle backward compatibility
         logger.info(
             "Note: Using legacy format. Consider using 'map' subcommand: python3 transform_myd_minimal.py map --object {} --variant {}".format(
-                (
-                    sys.argv[sys.argv.index("-object") + 1]
-                    if "-object" in sys.argv
-                    else "OBJECT"
-                ),
-                (
-                    sys.argv[sys.argv.index("-variant") + 1]
-                    if "-variant" in sys.argv
-                    else "VARIANT"
-                ),
+                (argv[argv.index("-object") + 1] if "-object" in argv else "OBJECT"),
+                (argv[argv.index("-variant") + 1] if "-variant" in argv else "VARIANT"),
             )
         )
 
@@ -99,7 +99,7 @@ def setup_cli():
             "--target-xml-worksheet", type=str, help="Worksheet name in target XML"
         )
 
-        args = old_parser.parse_args()
+        args = old_parser.parse_args(argv)
         config.merge_with_cli_args(args)
         return args, config, True  # True indicates legacy format
 
@@ -350,7 +350,7 @@ def setup_cli():
     )
 
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # If no command is specified, show help
     if args.command is None:
@@ -14,8 +14,9 @@ import sys
 from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
 import pandas as pd
 import yaml
@@ -90,6 +91,31 @@ class CentralMappingMemory:
     synonyms: Dict[str, List[str]]
 
 
+@dataclass(frozen=True, slots=True)
+class FieldDefinition:
+    """A single field definition parsed from a CSV field definition file."""
+
+    field_name: str
+    field_description: Optional[str]
+    dtype: str
+    field_count: int
+    length: Optional[int] = None
+    is_key: bool = False
+    nullable: bool = True
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the field as a dict compatible with analyze_column_data output."""
+        return _field_definition_dict(
+            self.field_name,
+            self.field_description,
+            self.dtype,
+            self.field_count,
+            self.length,
+            self.is_key,
+            self.nullable,
+        )
+
+
 class AdvancedFieldMatcher:
     """Advanced field matching system with multiple strategies."""
 
@@ -894,117 +920,208 @@ def apply_field_name_fallback(
     return enhanced_fields
 
 
-def parse_csv_field_definitions(csv_path: Path) -> List[Dict]:
+# Field definition CSV headers (matched case-insensitively) -> internal keys
+CSV_FIELD_DEFINITION_HEADERS = {
+    "table name": "table_name",
+    "field name": "field_name",
+    "data type": "data_type",
+    "field text": "field_text",
+    "length": "length",
+    "is key": "is_key",
+    "# of occ": "num_occ",
+    "from total": "from_total",
+}
+
+
+def _field_definition_dict(
+    field_name: str,
+    field_description: Optional[str],
+    dtype: str,
+    field_count: int,
+    length: Optional[int],
+    is_key: bool,
+    nullable: bool,
+) -> Dict[str, Any]:
+    """Build a field dict compatible with analyze_column_data output."""
+    field_def = {
+        "field_name": field_name,
+        "field_description": field_description,
+        "example": None,  # CSV format doesn't include examples
+        "field_count": field_count,
+        "dtype": dtype,
+        "nullable": nullable,
+    }
+
+    # Add length information if available
+    if length is not None:
+        field_def["length"] = length
+
+    # Add key information
+    if is_key:
+        field_def["is_key"] = True
+
+    return field_def
+
+
+def _iter_csv_field_definitions(
+    csv_path: Union[Path, str, TextIO],
+    make_row: Callable[..., Any],
+) -> Iterator[Any]:
     """
-    Parse CSV file containing field definitions with headers:
-    table name, field name, data type, field text, length, is key, # of occ, from total
+    Lazily parse CSV field definitions, yielding one row object per field.
 
     Args:
-        csv_path: Path to CSV file containing field definitions
-
-    Returns:
-        List of field dictionaries compatible with analyze_column_data output
+        csv_path: Path to CSV file containing field definitions, or an already
+            open text stream (e.g. ``io.StringIO``)
+        make_row: Row constructor taking (field_name, field_description, dtype,
+            field_count, length, is_key, nullable), e.g. FieldDefinition or
+            _field_definition_dict
+
+    Yields:
+        make_row result for each row that has a field name
     """
+    try:
+        # Accept open text streams as-is; only open (and close) real paths
+        if hasattr(csv_path, "read"):
+            yield from _parse_csv_field_definition_rows(csv_path, make_row)
+        else:
+            with open(csv_path, encoding="utf-8", newline="") as f:
+                yield from _parse_csv_field_definition_rows(f, make_row)
+
+    except Exception as e:
+        raise ValueError(f"Error parsing CSV field definitions from {csv_path}: {e}")
+
+
+def _parse_csv_field_definition_rows(
+    csv_file: TextIO, make_row: Callable[..., Any]
+) -> Iterator[Any]:
+    """Yield make_row(...) for each named row of an open field definition CSV."""
     import csv
 
-    try:
-        source_fields = []
-        field_count = 1
+    field_count = 1
+    reader = csv.reader(csv_file)
+
+    # Handle missing/empty header row defensively
+    header = next(reader, [])
+    if not header:
+        return
+
+    # Resolve column positions once per file (case-insensitive matching);
+    # on duplicate headers the last column wins, as with csv.DictReader
+    col_idx = {}
+    for idx, actual_header in enumerate(header):
+        key = CSV_FIELD_DEFINITION_HEADERS.get(actual_header.strip().casefold())
+        if key:
+            col_idx[key] = idx
+
+    idx_field_name = col_idx.get("field_name")
+    idx_data_type = col_idx.get("data_type")
+    idx_field_text = col_idx.get("field_text")
+    idx_length = col_idx.get("length")
+    idx_is_key = col_idx.get("is_key")
+
+    def cell(row: List[str], idx: Optional[int]) -> str:
+        """Return the stripped value at idx, or "" if absent."""
+        if idx is None or idx >= len(row):
+            return ""
+        return row[idx].strip()
 
-        with open(csv_path, encoding="utf-8") as f:
-            # Create CSV reader and detect headers
-            reader = csv.DictReader(f)
-
-            # Handle missing/empty fieldnames defensively
-            if not reader.fieldnames:
-                return source_fields
-
-            # Expected headers (case-insensitive matching)
-            expected_headers = {
-                "table name": "table_name",
-                "field name": "field_name",
-                "data type": "data_type",
-                "field text": "field_text",
-                "length": "length",
-                "is key": "is_key",
-                "# of occ": "num_occ",
-                "from total": "from_total",
-            }
+    # Process each row as a field definition
+    for row in reader:
+        # Skip empty rows
+        if not any(row):
+            continue
 
-            # Map actual headers to expected ones (case-insensitive)
-            header_mapping = {}
-            for actual_header in reader.fieldnames:
-                actual_lower = actual_header.lower().strip()
-                for expected, key in expected_headers.items():
-                    if actual_lower == expected:
-                        header_mapping[actual_header] = key
-                        break
+        field_name = cell(row, idx_field_name)
 
-            # Process each row as a field definition
-            for row in reader:
-                # Skip empty rows
-                if not any(row.values()):
-                    continue
-
-                # Extract field information using header mapping
-                field_name = ""
-                data_type = ""
-                field_description = ""
-                field_length = None
-                is_key = False
-
-                for actual_header, value in row.items():
-                    if not value:
-                        continue
-
-                    mapped_key = header_mapping.get(actual_header)
-                    if mapped_key == "field_name":
-                        field_name = str(value).strip()
-                    elif mapped_key == "data_type":
-                        data_type = str(value).strip()
-                    elif mapped_key == "field_text":
-                        # Use field_text for field_description
-                        field_description = str(value).strip()
-                    elif mapped_key == "length":
-                        # Parse length, stripping leading zeros
-                        length_str = str(value).strip()
-                        if length_str and length_str.isdigit():
-                            field_length = int(length_str.lstrip("0") or "0")
-                    elif mapped_key == "is_key":
-                        is_key = str(value).strip().upper() == "X"
-
-                # Skip rows without field names
-                if not field_name:
-                    continue
-
-                # Create field definition compatible with analyze_column_data output
-                field_def = {
-                    "field_name": field_name,
-                    "field_description": (
-                        field_description if field_description else None
-                    ),
-                    "example": None,  # CSV format doesn't include examples
-                    "field_count": field_count,
-                    "dtype": data_type if data_type else "string",  # Use data_type, fallback to string
-                    "nullable": not is_key,  # Key fields are typically not nullable
-                }
+        # Skip rows without field names
+        if not field_name:
+            continue
 
-                # Add length information if available
-                if field_length is not None:
-                    field_def["length"] = field_length
+        # Data types come from a small vocabulary; intern so rows share one str
+        data_type = sys.intern(cell(row, idx_data_type))
+        # Use field_text for field_description
+        field_description = cell(row, idx_field_text)
+
+        # Parse length; int() already ignores leading zeros ("000010" -> 10)
+        field_length = None
+        length_str = cell(row, idx_length)
+        if length_str.isdigit():
+            field_length = int(length_str)
+
+        is_key = cell(row, idx_is_key).upper() == "X"
+
+        yield make_row(
+            field_name,
+            field_description if field_description else None,
+            # Use data_type, fallback to string
+            data_type if data_type else "string",
+            field_count,
+            field_length,
+            is_key,
+            not is_key,  # Key fields are typically not nullable
+        )
+        field_count += 1
 
-                # Add key information
-                if is_key:
-                    field_def["is_key"] = True
 
-                source_fields.append(field_def)
-                field_count += 1
+def parse_csv_field_definitions_iter(
+    csv_path: Union[Path, str, TextIO],
+) -> Iterator[Dict]:
+    """
+    Lazily parse CSV field definitions, yielding one field dictionary per row.
 
-        return source_fields
+    Streaming variant of parse_csv_field_definitions for callers that only
+    iterate once; the CSV file stays open until the iterator is exhausted.
 
-    except Exception as e:
+    Args:
+        csv_path: Path to CSV file containing field definitions, or an already
+            open text stream (e.g. ``io.StringIO``)
+
+    Yields:
+        Field dictionaries compatible with analyze_column_data output
+    """
+    # Build dicts directly; FieldDefinition is only used for cached rows
+    yield from _iter_csv_field_definitions(csv_path, _field_definition_dict)
+
+
+def parse_csv_field_definitions(csv_path: Union[Path, str, TextIO]) -> List[Dict]:
+    """
+    Parse CSV file containing field definitions with headers:
+    table name, field name, data type, field text, length, is key, # of occ, from total
+
+    Args:
+        csv_path: Path to CSV file containing field definitions, or an already
+            open text stream (e.g. ``io.StringIO``)
+
+    Returns:
+        List of field dictionaries compatible with analyze_column_data output
+    """
+    if hasattr(csv_path, "read"):
+        return list(parse_csv_field_definitions_iter(csv_path))
+
+    # The CLI parses each file once per process; the cache is for library
+    # callers that re-read the same definition files. Resolve the path so
+    # different spellings of one file share a cache entry.
+    try:
+        resolved_path = Path(csv_path).resolve()
+        stat = resolved_path.stat()
+    except OSError as e:
         raise ValueError(f"Error parsing CSV field definitions from {csv_path}: {e}")
 
+    cached = _parse_csv_field_definitions_cached(
+        str(resolved_path), stat.st_mtime_ns, stat.st_size
+    )
+    # Fresh dicts per call, so callers can mutate the result freely
+    return [field_definition.as_dict() for field_definition in cached]
+
+
+@lru_cache(maxsize=64)
+def _parse_csv_field_definitions_cached(
+    csv_path: str, mtime_ns: int, size: int
+) -> Tuple[FieldDefinition, ...]:
+    """Parse a field definition CSV once per (path, mtime, size) combination."""
+    return tuple(_iter_csv_field_definitions(csv_path, FieldDefinition))
+
 
 def run_index_source_command(args, config):
     """Run the index_source command - parse headers from XLSX and create index_source.yaml."""
@@ -3755,14 +3872,19 @@ def run_transform_command(args, config):
         sys.exit(1)
 
 
-def main():
-    """Main entry point for the application."""
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the application.
+
+    Args:
+        argv: Command line arguments without the program name. Defaults to
+            ``sys.argv[1:]``, which allows calling the CLI in-process.
+    """
     from .logging_config import setup_logging
 
     # Initialize logging
     setup_logging()
 
-    args, config, is_legacy = setup_cli()
+    args, config, is_legacy = setup_cli(argv)
 
     # Execute the appropriate command
     if args.command == "index_source":
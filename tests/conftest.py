@@ -0,0 +1,138 @@
+"""Shared pytest fixtures."""
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+import yaml
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/worksheets/sheet1.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        '<row r="1"><c r="A1" t="inlineStr"><is><t>col1</t></is></c>'
+        '<c r="B1" t="inlineStr"><is><t>col2</t></is></c></row>'
+        '<row r="2"><c r="A2" t="inlineStr"><is><t>val1</t></is></c>'
+        '<c r="B2" t="inlineStr"><is><t>val2</t></is></c></row>'
+        "</sheetData></worksheet>"
+    ),
+}
+
+
+def _build_raw_xlsx_bytes() -> bytes:
+    """Assemble a minimal single-sheet workbook (col1/col2, one row) by hand."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for name, xml in _XLSX_PARTS.items():
+            archive.writestr(name, xml)
+    return buffer.getvalue()
+
+
+# Written verbatim to data/07_raw so fixtures don't need pandas/openpyxl to build it
+RAW_XLSX_BYTES = _build_raw_xlsx_bytes()
+
+
+@pytest.fixture(scope="session")
+def transform_fixture_dir(tmp_path_factory) -> Path:
+    """Build a test_obj/test_var migration tree without a template file.
+
+    The tree is created once per session; tests that run commands against it
+    should copy it first (``shutil.copytree``) so their outputs stay isolated.
+    """
+    tmppath = tmp_path_factory.mktemp("transform_fixture")
+
+    # Create minimal required directory structure
+    (tmppath / "data" / "07_raw").mkdir(parents=True, exist_ok=True)
+    (tmppath / "data" / "06_template").mkdir(parents=True, exist_ok=True)
+    (tmppath / "migrations" / "test_obj" / "test_var").mkdir(
+        parents=True, exist_ok=True
+    )
+
+    # Create a dummy raw data file
+    raw_file = tmppath / "data" / "07_raw" / "test_obj_test_var.xlsx"
+    raw_file.write_bytes(RAW_XLSX_BYTES)
+
+    # Create dummy mapping file
+    mapping_data = {
+        "metadata": {
+            "object": "test_obj",
+            "variant": "test_var",
+            "generated_at": "2025-01-01T00:00:00.000000",
+            "source_index": "migrations/test_obj/test_var/index_source.yaml",
+            "target_index": "migrations/test_obj/test_var/index_target.yaml",
+            "mapped_count": 0,
+            "unmapped_count": 1,
+            "to_audit": 0,
+            "unused_sources": 0,
+            "unused_targets": 1,
+        },
+        "mappings": [],
+    }
+    mapping_file = tmppath / "migrations" / "test_obj" / "test_var" / "mapping.yaml"
+    with open(mapping_file, "w") as f:
+        yaml.dump(mapping_data, f)
+
+    # Create dummy target index file
+    target_data = {
+        "metadata": {
+            "object": "test_obj",
+            "variant": "test_var",
+            "target_file": "data/02_target/test_obj_test_var.xml",
+            "generated_at": "2025-01-01T00:00:00.000000",
+            "structure": "S_TEST_VAR",
+            "target_fields_count": 1,
+        },
+        "target_fields": [
+            {
+                "target_field": "FIELD1",
+                "target_field_name": "FIELD1",
+                "target_field_description": "Test Field 1",
+                "target_table": "test_var",
+                "target_is_mandatory": True,
+                "target_field_group": "key",
+                "target_is_key": True,
+                "target_sheet_name": "Field List",
+                "target_data_type": "Text",
+                "target_length": 10,
+                "target_decimal": None,
+                "target_field_count": 1,
+            }
+        ],
+    }
+    target_file = tmppath / "migrations" / "test_obj" / "test_var" / "index_target.yaml"
+    with open(target_file, "w") as f:
+        yaml.dump(target_data, f)
+
+    # NOTE: We deliberately DO NOT create a template file
+    # Template should be at: data/06_template/S_TEST_VAR#*.csv
+
+    return tmppath
@@ -7,6 +7,11 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
+# Every test here runs the CLI in a fresh interpreter
+pytestmark = pytest.mark.slow
+
 
 def test_cli_help():
     """Test that the CLI help command works."""
@@ -8,6 +8,11 @@ import sys
 import tempfile
 from pathlib import Path
 
+import pytest
+
+# Every test here runs the CLI in a fresh interpreter
+pytestmark = pytest.mark.slow
+
 
 def run_command(cmd_args, cwd=None):
     """Run a command and return result."""
@@ -49,25 +54,24 @@ def test_no_html_flag():
     )
 
 
-def test_html_dir_flag():
+def test_html_dir_flag(tmp_path):
     """Test that --html-dir flag is accepted."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        result = run_command(
-            [
-                "index_source",
-                "--object",
-                "test",
-                "--variant",
-                "test",
-                "--html-dir",
-                tmpdir,
-            ]
-        )
-        # Command will fail due to missing files, but should not fail due to unknown flag
-        assert (
-            "--html-dir" not in result.stderr
-            or "unrecognized arguments" not in result.stderr
-        )
+    result = run_command(
+        [
+            "index_source",
+            "--object",
+            "test",
+            "--variant",
+            "test",
+            "--html-dir",
+            str(tmp_path),
+        ]
+    )
+    # Command will fail due to missing files, but should not fail due to unknown flag
+    assert (
+        "--html-dir" not in result.stderr
+        or "unrecognized arguments" not in result.stderr
+    )
 
 
 def test_command_completeness():
@@ -91,7 +95,8 @@ if __name__ == "__main__":
     test_no_html_flag()
     print("✓ --no-html flag test passed")
 
-    test_html_dir_flag()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_html_dir_flag(Path(tmpdir))
     print("✓ --html-dir flag test passed")
 
     test_command_completeness()
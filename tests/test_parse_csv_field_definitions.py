@@ -1,61 +1,194 @@
 """Tests for parse_csv_field_definitions function."""
 
-import tempfile
-from pathlib import Path
+import io
 
-from transform_myd_minimal.main import parse_csv_field_definitions
+import pytest
 
+from transform_myd_minimal.main import (
+    FieldDefinition,
+    _parse_csv_field_definitions_cached,
+    parse_csv_field_definitions,
+    parse_csv_field_definitions_iter,
+)
 
-def test_parse_csv_field_definitions_basic():
+BASIC_CSV = """table name,field name,data type,field text,length,is key,# of occ,from total
+TEST_TABLE,FIELD1,Character,First Field Description,000010,X,N/a,50
+TEST_TABLE,FIELD2,Numeric,Second Field Description,005,,100,100
+TEST_TABLE,FIELD3,Date,Third Field Description,8,,,100
+"""
+
+
+@pytest.fixture(scope="module")
+def basic_result():
+    """Parse BASIC_CSV once and share the result across the basic tests."""
+    return parse_csv_field_definitions(io.StringIO(BASIC_CSV))
+
+
+def test_parse_csv_field_definitions_basic_count(basic_result):
+    """Test basic CSV parsing yields one definition per data row."""
+    assert len(basic_result) == 3
+
+
+@pytest.mark.parametrize(
+    ("index", "expected"),
+    [
+        (
+            0,
+            {
+                "field_name": "FIELD1",
+                "field_description": "First Field Description",
+                "example": None,
+                "field_count": 1,
+                "dtype": "Character",
+                "nullable": False,  # Key fields are not nullable
+                "length": 10,
+                "is_key": True,
+            },
+        ),
+        (
+            1,
+            {
+                "field_name": "FIELD2",
+                "field_description": "Second Field Description",
+                "example": None,
+                "field_count": 2,
+                "dtype": "Numeric",
+                "nullable": True,
+                "length": 5,
+            },
+        ),
+        (
+            2,
+            {
+                "field_name": "FIELD3",
+                "field_description": "Third Field Description",
+                "example": None,
+                "field_count": 3,
+                "dtype": "Date",
+                "nullable": True,
+                "length": 8,
+            },
+        ),
+    ],
+)
+def test_parse_csv_field_definitions_basic(basic_result, index, expected):
     """Test basic CSV parsing with all columns."""
-    # Create a temporary CSV file with test data
+    assert basic_result[index] == expected
+
+
+def test_field_definition_as_dict():
+    """Test FieldDefinition serializes to the analyze_column_data dict shape."""
+    key_field = FieldDefinition(
+        field_name='FIELD1',
+        field_description=None,
+        dtype='Character',
+        field_count=1,
+        length=10,
+        is_key=True,
+        nullable=False,
+    )
+    assert key_field.as_dict() == {
+        'field_name': 'FIELD1',
+        'field_description': None,
+        'example': None,
+        'field_count': 1,
+        'dtype': 'Character',
+        'nullable': False,
+        'length': 10,
+        'is_key': True,
+    }
+
+    # Optional length and is_key are omitted when unset
+    plain_field = FieldDefinition('FIELD2', 'Text', 'string', 2)
+    assert 'length' not in plain_field.as_dict()
+    assert 'is_key' not in plain_field.as_dict()
+    assert plain_field.as_dict()['nullable'] is True
+
+
+def test_parse_csv_field_definitions_iter_is_lazy():
+    """Test the streaming variant yields the same rows one at a time."""
+    fields = parse_csv_field_definitions_iter(io.StringIO(BASIC_CSV))
+
+    first = next(fields)
+    assert first['field_name'] == 'FIELD1'
+    assert first['field_count'] == 1
+    assert [field['field_name'] for field in fields] == ['FIELD2', 'FIELD3']
+
+
+def test_parse_csv_field_definitions_from_path(tmp_path):
+    """Test CSV parsing from a file path on disk."""
     csv_content = """table name,field name,data type,field text,length,is key,# of occ,from total
 TEST_TABLE,FIELD1,Character,First Field Description,000010,X,N/a,50
 TEST_TABLE,FIELD2,Numeric,Second Field Description,005,,100,100
-TEST_TABLE,FIELD3,Date,Third Field Description,8,,,100
 """
+    csv_path = tmp_path / "fields.csv"
+    csv_path.write_text(csv_content, encoding="utf-8")
+
+    result = parse_csv_field_definitions(csv_path)
+
+    assert len(result) == 2
+    assert result[0]['field_name'] == 'FIELD1'
+    assert result[0]['length'] == 10
+    assert result[0]['is_key'] is True
+    assert result[1]['field_name'] == 'FIELD2'
+    assert result[1]['dtype'] == 'Numeric'
+
+
+def test_parse_csv_field_definitions_path_cache(tmp_path):
+    """Test repeated path parses are cached, copied out, and invalidated on change."""
+    csv_path = tmp_path / "fields.csv"
+    csv_path.write_text("field name,data type\nFIELD1,Character\n", encoding="utf-8")
+
+    first = parse_csv_field_definitions(csv_path)
+    first[0]['dtype'] = 'mutated'
+    second = parse_csv_field_definitions(csv_path)
+    assert second[0]['dtype'] == 'Character'
+
+    csv_path.write_text(
+        "field name,data type\nFIELD1,Character\nFIELD2,Numeric\n", encoding="utf-8"
+    )
+    assert [field['field_name'] for field in parse_csv_field_definitions(csv_path)] == [
+        'FIELD1',
+        'FIELD2',
+    ]
+
+
+def test_parse_csv_field_definitions_path_cache_resolves_path(tmp_path, monkeypatch):
+    """Test different spellings of one path share a single cache entry."""
+    (tmp_path / "sub").mkdir()
+    csv_path = tmp_path / "fields.csv"
+    csv_path.write_text("field name\nFIELD1\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    _parse_csv_field_definitions_cached.cache_clear()
+    parse_csv_field_definitions(csv_path)
+    parse_csv_field_definitions("fields.csv")
+    parse_csv_field_definitions(tmp_path / "sub" / ".." / "fields.csv")
+
+    cache_info = _parse_csv_field_definitions_cached.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
+def test_parse_csv_field_definitions_missing_path(tmp_path):
+    """Test a missing CSV path is reported as ValueError."""
+    with pytest.raises(ValueError, match="Error parsing CSV field definitions"):
+        parse_csv_field_definitions(tmp_path / "missing.csv")
+
+
+def test_parse_csv_field_definitions_lengths():
+    """Test zero-padded, all-zero and non-numeric lengths."""
+    csv_content = """field name,length
+FIELD1,000010
+FIELD2,000
+FIELD3,N/a
+"""
+
+    result = parse_csv_field_definitions(io.StringIO(csv_content))
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-        f.write(csv_content)
-        csv_path = Path(f.name)
-
-    try:
-        # Parse the CSV
-        result = parse_csv_field_definitions(csv_path)
-
-        # Assertions
-        assert len(result) == 3
-
-        # Check FIELD1
-        field1 = result[0]
-        assert field1['field_name'] == 'FIELD1'
-        assert field1['field_description'] == 'First Field Description'
-        assert field1['dtype'] == 'Character'
-        assert field1['field_count'] == 1
-        assert field1['length'] == 10
-        assert field1['is_key'] is True
-        assert field1['nullable'] is False  # Key fields are not nullable
-
-        # Check FIELD2
-        field2 = result[1]
-        assert field2['field_name'] == 'FIELD2'
-        assert field2['field_description'] == 'Second Field Description'
-        assert field2['dtype'] == 'Numeric'
-        assert field2['field_count'] == 2
-        assert field2['length'] == 5
-        assert field2.get('is_key') is None
-        assert field2['nullable'] is True
-
-        # Check FIELD3
-        field3 = result[2]
-        assert field3['field_name'] == 'FIELD3'
-        assert field3['field_description'] == 'Third Field Description'
-        assert field3['dtype'] == 'Date'
-        assert field3['field_count'] == 3
-        assert field3['length'] == 8
-
-    finally:
-        csv_path.unlink()
+    assert result[0]['length'] == 10
+    assert result[1]['length'] == 0
+    assert 'length' not in result[2]
 
 
 def test_parse_csv_field_definitions_empty_field_text():
@@ -64,22 +197,14 @@ def test_parse_csv_field_definitions_empty_field_text():
 TEST_TABLE,FIELD1,Character,,000010,X,N/a,50
 """
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-        f.write(csv_content)
-        csv_path = Path(f.name)
+    result = parse_csv_field_definitions(io.StringIO(csv_content))
 
-    try:
-        result = parse_csv_field_definitions(csv_path)
-
-        assert len(result) == 1
-        field1 = result[0]
-        assert field1['field_name'] == 'FIELD1'
-        # When field_text is empty, description should be None
-        assert field1['field_description'] is None
-        assert field1['dtype'] == 'Character'
-
-    finally:
-        csv_path.unlink()
+    assert len(result) == 1
+    field1 = result[0]
+    assert field1['field_name'] == 'FIELD1'
+    # When field_text is empty, description should be None
+    assert field1['field_description'] is None
+    assert field1['dtype'] == 'Character'
 
 
 def test_parse_csv_field_definitions_empty_data_type():
@@ -88,22 +213,14 @@ def test_parse_csv_field_definitions_empty_data_type():
 TEST_TABLE,FIELD1,,Field Description,000010,X,N/a,50
 """
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-        f.write(csv_content)
-        csv_path = Path(f.name)
-
-    try:
-        result = parse_csv_field_definitions(csv_path)
+    result = parse_csv_field_definitions(io.StringIO(csv_content))
 
-        assert len(result) == 1
-        field1 = result[0]
-        assert field1['field_name'] == 'FIELD1'
-        assert field1['field_description'] == 'Field Description'
-        # When data_type is empty, dtype should fallback to 'string'
-        assert field1['dtype'] == 'string'
-
-    finally:
-        csv_path.unlink()
+    assert len(result) == 1
+    field1 = result[0]
+    assert field1['field_name'] == 'FIELD1'
+    assert field1['field_description'] == 'Field Description'
+    # When data_type is empty, dtype should fallback to 'string'
+    assert field1['dtype'] == 'string'
 
 
 def test_parse_csv_field_definitions_missing_columns():
@@ -114,21 +231,13 @@ FIELD1
 FIELD2
 """
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-        f.write(csv_content)
-        csv_path = Path(f.name)
-
-    try:
-        result = parse_csv_field_definitions(csv_path)
-
-        assert len(result) == 2
-        field1 = result[0]
-        assert field1['field_name'] == 'FIELD1'
-        assert field1['field_description'] is None
-        assert field1['dtype'] == 'string'  # Default fallback
+    result = parse_csv_field_definitions(io.StringIO(csv_content))
 
-    finally:
-        csv_path.unlink()
+    assert len(result) == 2
+    field1 = result[0]
+    assert field1['field_name'] == 'FIELD1'
+    assert field1['field_description'] is None
+    assert field1['dtype'] == 'string'  # Default fallback
 
 
 def test_parse_csv_field_definitions_case_insensitive_headers():
@@ -137,21 +246,13 @@ def test_parse_csv_field_definitions_case_insensitive_headers():
 TEST_TABLE,FIELD1,Character,Field Description
 """
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-        f.write(csv_content)
-        csv_path = Path(f.name)
+    result = parse_csv_field_definitions(io.StringIO(csv_content))
 
-    try:
-        result = parse_csv_field_definitions(csv_path)
-
-        assert len(result) == 1
-        field1 = result[0]
-        assert field1['field_name'] == 'FIELD1'
-        assert field1['field_description'] == 'Field Description'
-        assert field1['dtype'] == 'Character'
-
-    finally:
-        csv_path.unlink()
+    assert len(result) == 1
+    field1 = result[0]
+    assert field1['field_name'] == 'FIELD1'
+    assert field1['field_description'] == 'Field Description'
+    assert field1['dtype'] == 'Character'
 
 
 def test_parse_csv_field_definitions_empty_file():
@@ -159,16 +260,8 @@ def test_parse_csv_field_definitions_empty_file():
     csv_content = """table name,field name,data type,field text,length,is key,# of occ,from total
 """
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-        f.write(csv_content)
-        csv_path = Path(f.name)
-
-    try:
-        result = parse_csv_field_definitions(csv_path)
-        assert len(result) == 0
-
-    finally:
-        csv_path.unlink()
+    result = parse_csv_field_definitions(io.StringIO(csv_content))
+    assert len(result) == 0
 
 
 def test_parse_csv_field_definitions_skip_empty_rows():
@@ -179,19 +272,11 @@ TEST_TABLE,FIELD1,Character,Field Description
 TEST_TABLE,FIELD2,Numeric,Another Description
 """
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-        f.write(csv_content)
-        csv_path = Path(f.name)
-
-    try:
-        result = parse_csv_field_definitions(csv_path)
-
-        assert len(result) == 2
-        assert result[0]['field_name'] == 'FIELD1'
-        assert result[1]['field_name'] == 'FIELD2'
+    result = parse_csv_field_definitions(io.StringIO(csv_content))
 
-    finally:
-        csv_path.unlink()
+    assert len(result) == 2
+    assert result[0]['field_name'] == 'FIELD1'
+    assert result[1]['field_name'] == 'FIELD2'
 
 
 def test_parse_csv_field_definitions_no_fieldnames():
@@ -199,14 +284,6 @@ def test_parse_csv_field_definitions_no_fieldnames():
     # Empty CSV file - no headers
     csv_content = ""
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
-        f.write(csv_content)
-        csv_path = Path(f.name)
-
-    try:
-        result = parse_csv_field_definitions(csv_path)
-        # Should return empty list without crashing
-        assert len(result) == 0
-
-    finally:
-        csv_path.unlink()
+    result = parse_csv_field_definitions(io.StringIO(csv_content))
+    # Should return empty list without crashing
+    assert len(result) == 0